@@ -0,0 +1,4 @@
+OUTPUT_BUFFER_SIZE = 128 * 1024  # 128 KiB, fewer write syscalls on large output
+READ_CHUNK_SIZE = 128 * 1024  # chunk size for streaming file reads
+GREP_BUFFER_SIZE = 1024 * 1024  # 1 MiB read buffer for line scanning
+MMAP_THRESHOLD = 4 * 1024 * 1024  # files above this are read via mmap
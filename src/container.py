@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from logging import Logger
 
 from src.services.base import OSConsoleServiceBase
 
@@ -6,3 +7,4 @@ from src.services.base import OSConsoleServiceBase
 @dataclass
 class Container:
     console_service: OSConsoleServiceBase
+    logger: Logger
@@ -1,6 +1,11 @@
-from enum import Enum
+from enum import IntEnum
 
 
-class FileReadMode(str, Enum):
-    string = ("string",)
-    bytes = ("bytes",)
+class FileReadMode(IntEnum):
+    string = 0
+    bytes = 1
+
+
+class FileDisplayMode(IntEnum):
+    simple = 0
+    detailed = 1
@@ -0,0 +1,17 @@
+import atexit
+import logging.config
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+from src.config import LOGGING_CONFIG
+
+
+def setup_logging() -> None:
+    logging.config.dictConfig(LOGGING_CONFIG)
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    queue: SimpleQueue = SimpleQueue()
+    root.handlers = [QueueHandler(queue)]
+    listener = QueueListener(queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
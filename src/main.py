@@ -1,63 +1,144 @@
-from src.config import LOGGING_CONFIG
-
-import logging.config
+import functools
+import io
+import logging
+import os
+import stat
 import sys
 from pathlib import Path
 
 import typer
 from typer import Typer, Context
 
+from src.constants import OUTPUT_BUFFER_SIZE
 from src.container import Container
-from src.enums import FileReadMode
+from src.enums import FileDisplayMode, FileReadMode
+from src.logging_setup import setup_logging
 from src.services.windows_console import WindowsConsoleService
 
+setup_logging()
+_LOGGER = logging.getLogger(__name__)
+
 app = Typer()
 
+_PATH_ARG = typer.Argument(..., exists=False, readable=False, help="Path")
+_SOURCE_ARG = typer.Argument(..., exists=False, readable=False, help="Source path")
+_DESTINATION_ARG = typer.Argument(
+    ..., exists=False, readable=False, help="Destination path"
+)
+_ARCHIVE_ARG = typer.Argument(..., exists=False, readable=False, help="Archive path")
+_RECURSIVE_OPT = typer.Option(
+    False, "--recursive", "-r", help="Recurse into directories"
+)
+_BYTES_OPT = typer.Option(False, "--bytes", "-b", help="Read as bytes")
+_DETAILED_OPT = typer.Option(
+    False, "--detailed", "-l", help="Show permissions, size and mtime"
+)
+_IGNORE_CASE_OPT = typer.Option(
+    False, "--ignore-case", "-i", help="Case-insensitive search"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: bytes, flags: int):
+    """Memoized compile so repeated shell greps skip re.compile."""
+    import re
+
+    return re.compile(pattern, flags)
+
 
 def get_container(ctx: Context) -> Container:
     container = ctx.obj
-    if not isinstance(container, Container):
+    if type(container) is not Container:
         raise RuntimeError("DI container is not initialized")
     return container
 
 
 @app.callback()
-def main(ctx: Context):
-    logging.config.dictConfig(LOGGING_CONFIG)
-    logger = logging.getLogger(__name__)
+def main(
+    ctx: Context,
+    verbose: bool = typer.Option(False, "--verbose", help="Enable debug logging"),
+):
+    if verbose:
+        logging.getLogger().setLevel(logging.DEBUG)
     ctx.obj = Container(
-        console_service=WindowsConsoleService(logger=logger),
+        console_service=WindowsConsoleService(logger=_LOGGER),
+        logger=_LOGGER,
     )
 
 
 @app.command()
 def ls(
     ctx: Context,
-    path: Path = typer.Argument(
-        ..., exists=False, readable=False, help="File to print"
-    ),
+    path: Path = _PATH_ARG,
+    detailed: bool = _DETAILED_OPT,
+    limit: int = typer.Option(None, "--limit", help="Show at most N entries"),
+    offset: int = typer.Option(0, "--offset", help="Skip the first N entries"),
 ) -> None:
     """
     List all files in a directory.
     :param ctx:   typer context object for imitating di container
     :param path:  path to directory to list
+    :param detailed: show permissions, size and mtime per entry
+    :param limit: show at most this many entries
+    :param offset: skip this many entries first
     :return: content of directory
     """
     try:
         container: Container = get_container(ctx)
-        content = container.console_service.ls(path)
-        sys.stdout.writelines(content)
+        display_mode = (
+            FileDisplayMode.detailed if detailed else FileDisplayMode.simple
+        )
+        content = container.console_service.ls(
+            path, mode=display_mode, limit=limit, offset=offset
+        )
+        with open(
+            sys.stdout.fileno(), "wb", buffering=OUTPUT_BUFFER_SIZE, closefd=False
+        ) as buffer:
+            text = io.TextIOWrapper(buffer, encoding="utf-8", write_through=False)
+            text.writelines(content)
+            text.detach()
     except OSError as e:
         typer.echo(e)
 
 
+def _sendfile_cat(filename: Path) -> bool:
+    """
+    Copy a file to stdout inside the kernel via os.sendfile.
+    Only applies when stdout is a regular file or a pipe; returns
+    False when unsupported so the caller can fall back to streaming.
+    """
+    if not hasattr(os, "sendfile"):
+        return False
+    out_fd = sys.stdout.fileno()
+    try:
+        out_mode = os.fstat(out_fd).st_mode
+        if not (stat.S_ISREG(out_mode) or stat.S_ISFIFO(out_mode)):
+            return False
+        in_fd = os.open(str(filename), os.O_RDONLY)
+    except OSError:
+        return False
+    sent_any = False
+    try:
+        if not stat.S_ISREG(os.fstat(in_fd).st_mode):
+            return False
+        while os.sendfile(out_fd, in_fd, None, 1 << 20):
+            sent_any = True
+        return True
+    except OSError:
+        if sent_any:
+            # Mid-transfer failure: a fallback re-stream would append
+            # a second full copy after the bytes already written.
+            raise
+        return False
+    finally:
+        os.close(in_fd)
+
+
 @app.command()
 def cat(
     ctx: Context,
-    filename: Path = typer.Argument(
-        ..., exists=False, readable=False, help="File to print"
-    ),
-    mode: bool = typer.Option(False, "--bytes", "-b", help="Read as bytes"),
+    filename: Path = _PATH_ARG,
+    mode: bool = _BYTES_OPT,
 ):
     """
     Cat a file
@@ -68,18 +149,279 @@ def cat(
     """
     try:
         container: Container = get_container(ctx)
-        file_mode = FileReadMode.bytes if mode else FileReadMode.string
-        data = container.console_service.cat(
-            filename,
-            mode=file_mode,
+        if _sendfile_cat(filename):
+            return
+        with open(
+            sys.stdout.fileno(), "wb", buffering=OUTPUT_BUFFER_SIZE, closefd=False
+        ) as buffer:
+            if mode:
+                for chunk in container.console_service.cat(
+                    filename, mode=FileReadMode.bytes
+                ):
+                    buffer.write(chunk)
+            else:
+                text = io.TextIOWrapper(buffer, encoding="utf-8", write_through=False)
+                for piece in container.console_service.cat(
+                    filename, mode=FileReadMode.string
+                ):
+                    text.write(piece)
+                text.detach()
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def grep(
+    ctx: Context,
+    pattern: str = typer.Argument(..., help="Pattern to search for"),
+    path: Path = _PATH_ARG,
+    ignore_case: bool = _IGNORE_CASE_OPT,
+) -> None:
+    """
+    Search a file, or every file under a directory, for lines
+    matching a regex pattern.
+    :param ctx: typer context object for imitating di container
+    :param pattern: regex pattern to search for
+    :param path: file or directory to search
+    :param ignore_case: ignore case when matching
+    :return: matching lines prefixed with line numbers
+    """
+    import re
+
+    try:
+        container: Container = get_container(ctx)
+        compiled = _compile_pattern(
+            pattern.encode("utf-8"), re.IGNORECASE * ignore_case
         )
-        if isinstance(data, bytes):
-            sys.stdout.buffer.write(data)
-        else:
-            sys.stdout.write(data)
+        matches = container.console_service.grep(compiled, path)
+        with open(
+            sys.stdout.fileno(), "wb", buffering=OUTPUT_BUFFER_SIZE, closefd=False
+        ) as buffer:
+            buffer.writelines(matches)
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def cd(
+    ctx: Context,
+    path: Path = _PATH_ARG,
+) -> None:
+    """
+    Change the current working directory.
+    :param ctx: typer context object for imitating di container
+    :param path: path to directory to change to
+    :return: the new working directory
+    """
+    try:
+        container: Container = get_container(ctx)
+        new_path = container.console_service.cd(path)
+        os.write(
+            sys.stdout.fileno(),
+            (str(new_path) + "\n").encode(sys.stdout.encoding or "utf-8"),
+        )
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def cp(
+    ctx: Context,
+    source: Path = _SOURCE_ARG,
+    destination: Path = _DESTINATION_ARG,
+    recursive: bool = _RECURSIVE_OPT,
+) -> None:
+    """
+    Copy a file or directory.
+    :param ctx: typer context object for imitating di container
+    :param source: file or directory to copy
+    :param destination: destination path
+    :param recursive: copy directories recursively
+    :return:
+    """
+    try:
+        container: Container = get_container(ctx)
+        container.console_service.cp(source, destination, recursive=recursive)
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def mv(
+    ctx: Context,
+    source: Path = _SOURCE_ARG,
+    destination: Path = _DESTINATION_ARG,
+) -> None:
+    """
+    Move or rename a file or directory.
+    :param ctx: typer context object for imitating di container
+    :param source: file or directory to move
+    :param destination: destination path
+    :return:
+    """
+    try:
+        container: Container = get_container(ctx)
+        container.console_service.mv(source, destination)
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def rm(
+    ctx: Context,
+    path: Path = _PATH_ARG,
+    recursive: bool = _RECURSIVE_OPT,
+) -> None:
+    """
+    Remove a file or directory.
+    :param ctx: typer context object for imitating di container
+    :param path: file or directory to remove
+    :param recursive: remove directories recursively
+    :return:
+    """
+    try:
+        container: Container = get_container(ctx)
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            typer.echo(f"File not found: {path}")
+            return
+        is_dir = stat.S_ISDIR(st.st_mode)
+        if is_dir and not recursive:
+            typer.echo(f"{path} is a directory, use --recursive")
+            return
+        if is_dir:
+            typer.confirm(f"Remove directory {path}?", abort=True)
+        container.console_service.rm(path, recursive=recursive)
     except OSError as e:
         typer.echo(e)
 
 
+@app.command()
+def zip(
+    ctx: Context,
+    source: Path = _SOURCE_ARG,
+    archive: Path = _ARCHIVE_ARG,
+) -> None:
+    """
+    Create a zip archive from a directory.
+    :param ctx: typer context object for imitating di container
+    :param source: directory to archive
+    :param archive: target zip archive path
+    :return:
+    """
+    try:
+        container: Container = get_container(ctx)
+        container.console_service.zip(source, archive)
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def unzip(
+    ctx: Context,
+    archive: Path = _ARCHIVE_ARG,
+    destination: Path = _DESTINATION_ARG,
+) -> None:
+    """
+    Extract a zip archive into a directory.
+    :param ctx: typer context object for imitating di container
+    :param archive: zip archive to extract
+    :param destination: directory to extract into
+    :return:
+    """
+    try:
+        container: Container = get_container(ctx)
+        container.console_service.unzip(archive, destination)
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def tar(
+    ctx: Context,
+    source: Path = _SOURCE_ARG,
+    archive: Path = _ARCHIVE_ARG,
+) -> None:
+    """
+    Create a gzipped tar archive from a directory.
+    :param ctx: typer context object for imitating di container
+    :param source: directory to archive
+    :param archive: target tar.gz archive path
+    :return:
+    """
+    try:
+        container: Container = get_container(ctx)
+        container.console_service.tar_dir(source, archive)
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def untar(
+    ctx: Context,
+    archive: Path = _ARCHIVE_ARG,
+    destination: Path = _DESTINATION_ARG,
+) -> None:
+    """
+    Extract a tar archive into a directory.
+    :param ctx: typer context object for imitating di container
+    :param archive: tar archive to extract
+    :param destination: directory to extract into
+    :return:
+    """
+    try:
+        container: Container = get_container(ctx)
+        container.console_service.untar(archive, destination)
+    except OSError as e:
+        typer.echo(e)
+
+
+@app.command()
+def shell(ctx: Context) -> None:
+    """
+    Run an interactive shell dispatching to the other commands.
+    :param ctx: typer context object for imitating di container
+    :return:
+    """
+    import shlex
+
+    while True:
+        try:
+            line = input("$ ")
+        except EOFError:
+            break
+        argv = shlex.split(line)
+        if not argv:
+            continue
+        if argv[0] in ("exit", "quit"):
+            break
+        try:
+            if len(argv) == 2 and argv[0] in _FAST_DISPATCH:
+                _FAST_DISPATCH[argv[0]](ctx, argv[1])
+            else:
+                app(argv, standalone_mode=False, obj=ctx.obj)
+        except Exception as e:
+            typer.echo(e)
+
+
+# Resolved once so the shell fast path can skip Click's per-call
+# parameter introspection for already-validated simple forms.
+# CommandInfo.callback is Optional; every command registered above has
+# one, and the filter also narrows the dict values for mypy.
+_CMDS = {
+    info.callback.__name__: info.callback
+    for info in app.registered_commands
+    if info.callback is not None
+}
+_FAST_DISPATCH = {
+    "ls": lambda ctx, arg: _CMDS["ls"](
+        ctx, path=Path(arg), detailed=False, limit=None, offset=0
+    ),
+    "cat": lambda ctx, arg: _CMDS["cat"](ctx, filename=Path(arg), mode=False),
+    "cd": lambda ctx, arg: _CMDS["cd"](ctx, path=Path(arg)),
+}
+
+
 if __name__ == "__main__":
     app()
@@ -1,17 +1,143 @@
+import os
+import re
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from os import PathLike
-from typing import Literal
+from pathlib import Path
+from typing import Literal, overload
 
-from src.enums import FileReadMode
+from src.enums import FileDisplayMode, FileReadMode
+
+IO_BUF = 128 * 1024  # minimum copy buffer for archive I/O, see shutil.copyfileobj
 
 
 class OSConsoleServiceBase(ABC):
     @abstractmethod
-    def ls(self, path: PathLike[str] | str) -> list[str]: ...
+    def ls(
+        self,
+        path: PathLike[str] | str,
+        mode: FileDisplayMode = FileDisplayMode.simple,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> Iterator[str]:
+        """
+        Yield directory entries as printable lines.
+        limit/offset slice the sorted listing so callers paginating a
+        huge directory do not pay to format every entry.
+        Detailed mode must walk the directory with os.scandir (see
+        _iter_entries) and read metadata via
+        DirEntry.stat(follow_symlinks=False), which reuses the stat
+        cached from the directory read instead of issuing a second
+        syscall per entry. Simple mode needs names only and may use
+        the cheapest listing available (e.g. os.listdir).
+        """
+
+    @staticmethod
+    def _iter_entries(path: PathLike[str] | str) -> Iterator[os.DirEntry]:
+        with os.scandir(path) as it:
+            yield from it
+
+    # Overloaded on the mode so callers get a correctly typed chunk
+    # iterator instead of a blind str | bytes union.
+    @overload
+    def cat(
+        self,
+        filename: PathLike | str,
+        mode: Literal[FileReadMode.string] = ...,
+    ) -> Iterator[str]: ...
+
+    @overload
+    def cat(
+        self,
+        filename: PathLike | str,
+        mode: Literal[FileReadMode.bytes],
+    ) -> Iterator[bytes]: ...
 
     @abstractmethod
     def cat(
         self,
         filename: PathLike | str,
-        mode: Literal[FileReadMode.string, FileReadMode.bytes] = FileReadMode.string,
-    ) -> str | bytes: ...
+        mode: FileReadMode = FileReadMode.string,
+    ) -> Iterator[str | bytes]: ...
+
+    @abstractmethod
+    def grep(
+        self,
+        pattern: re.Pattern[bytes],
+        path: PathLike[str] | str,
+    ) -> Iterator[bytes]: ...
+
+    @abstractmethod
+    def cd(self, path: PathLike[str] | str) -> Path: ...
+
+    @abstractmethod
+    def cp(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+        recursive: bool = False,
+    ) -> None: ...
+
+    @abstractmethod
+    def mv(
+        self,
+        source: PathLike[str] | str,
+        destination: PathLike[str] | str,
+    ) -> None: ...
+
+    @abstractmethod
+    def rm(
+        self,
+        path: PathLike[str] | str,
+        recursive: bool = False,
+    ) -> None: ...
+
+    @abstractmethod
+    def zip(
+        self,
+        source: PathLike[str] | str,
+        archive: PathLike[str] | str,
+    ) -> None:
+        """
+        Archive a directory into a zip file.
+        Implementations must stream member data to the compressor -
+        through buffers of at least IO_BUF bytes or directly from an
+        mmap - rather than loading whole files into memory.
+        """
+
+    @abstractmethod
+    def unzip(
+        self,
+        archive: PathLike[str] | str,
+        destination: PathLike[str] | str,
+    ) -> None:
+        """
+        Extract a zip archive.
+        Implementations may delegate to ZipFile.extractall, which
+        streams members through zipfile's own buffers.
+        """
+
+    @abstractmethod
+    def tar_dir(
+        self,
+        source: PathLike[str] | str,
+        archive: PathLike[str] | str,
+    ) -> None:
+        """
+        Archive a directory into a gzipped tar file.
+        Implementations must stream members through tarfile rather
+        than loading whole files, and may substitute a faster deflate
+        backend for stdlib gzip.
+        """
+
+    @abstractmethod
+    def untar(
+        self,
+        archive: PathLike[str] | str,
+        destination: PathLike[str] | str,
+    ) -> None:
+        """
+        Extract a tar archive.
+        Implementations may delegate to TarFile.extractall, which
+        streams members through tarfile's own buffers.
+        """
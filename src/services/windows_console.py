@@ -1,44 +1,760 @@
+import os
+import re
+import shutil
+import stat
+import sys
+import time
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from logging import Logger
 from os import (PathLike)
 from pathlib import Path
+from types import ModuleType
+from typing import Literal, overload
 
-from src.enums import FileReadMode
-from src.services.base import OSConsoleServiceBase
+from src.constants import GREP_BUFFER_SIZE, MMAP_THRESHOLD, READ_CHUNK_SIZE
+from src.enums import FileDisplayMode, FileReadMode
+from src.services.base import IO_BUF, OSConsoleServiceBase
+
+
+# Every possible 12-bit permission mask, formatted once at import;
+# prefix-free octal padded for column alignment, so 0o755 renders
+# as " 755" rather than Python repr syntax.
+_MODE_STR = tuple(format(i, "o").rjust(4) for i in range(0o10000))
+
+# Timestamp strings memoized per whole second: files written by the
+# same build or extraction share a second, so large listings reuse the
+# same handful of formatted values.
+_MTIME_CACHE: dict[int, str] = {}
+
+# Pre-bound os attributes for the cd hot path.
+_getcwd = os.getcwd
+_chdir = os.chdir
+_expanduser = os.path.expanduser
+
+
+class _MultithreadedCopier(ThreadPoolExecutor):
+    """
+    shutil.copytree copy_function that fans file copies out to worker
+    threads. Workers spend their time blocked in kernel copy calls
+    with the GIL released, so the tree walk overlaps the data moves.
+    """
+
+    def __init__(self, copy_function, max_workers: int = 8):
+        super().__init__(max_workers=max_workers)
+        self._copy_function = copy_function
+        self._futures: list[Future] = []
+
+    def copy(self, src: str, dst: str) -> None:
+        self._futures.append(self.submit(self._copy_function, src, dst))
+
+    def wait_all(self) -> None:
+        """Propagate the first worker exception, if any."""
+        for future in self._futures:
+            future.result()
 
 
 class WindowsConsoleService(OSConsoleServiceBase):
     def __init__(self, logger: Logger):
         self._logger = logger
 
-    def ls(self, path: PathLike[str] | str) -> list[str]:
-        path = Path(path)
-        if not path.exists():
-            self._logger.error(f"Folder not found: {path}")
+    @staticmethod
+    def _stat_or_none(path: PathLike[str] | str) -> os.stat_result | None:
+        """One stat covering both the existence and file-type checks."""
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    @staticmethod
+    def _is_remote(path: PathLike[str] | str) -> bool:
+        """True when the path lives on a network drive (Windows only)."""
+        if sys.platform != "win32":
+            return False
+        import ctypes
+        drive = os.path.splitdrive(os.path.abspath(os.fspath(path)))[0] + "\\"
+        drive_remote = 4  # DRIVE_REMOTE
+        return ctypes.windll.kernel32.GetDriveTypeW(drive) == drive_remote
+
+    def ls_iter(self, path: PathLike[str] | str) -> Iterator[str]:
+        """Yield entry names unsorted with O(1) memory."""
+        for entry in self._iter_entries(path):
+            yield entry.name + "\n"
+
+    def ls(
+            self,
+            path: PathLike[str] | str,
+            mode: FileDisplayMode = FileDisplayMode.simple,
+            limit: int | None = None,
+            offset: int = 0,
+    ) -> Iterator[str]:
+        path = os.fspath(path)
+        st = self._stat_or_none(path)
+        if st is None:
+            self._logger.error("Folder not found: %s", path)
             raise FileNotFoundError(path)
-        if not path.is_dir():
-            self._logger.error(f"You entered {path} is not a directory")
+        if not stat.S_ISDIR(st.st_mode):
+            self._logger.error("You entered %s is not a directory", path)
             raise NotADirectoryError(path)
-        self._logger.info(f"Listing {path}")
-        return [entry.name + "\n" for entry in path.iterdir()]
+        self._logger.info("Listing %s in mode %s", path, mode)
+        # Single fused pass: each DirEntry is touched once to build
+        # both its precomputed sort key (type bit, casefolded name,
+        # stable index) and its output line, then only the formatted
+        # rows are kept for the sort.
+        if mode == FileDisplayMode.detailed:
+            source: Iterator[os.DirEntry] | list[os.DirEntry]
+            source = self._iter_entries(path)
+            if self._is_remote(path):
+                # Each stat is a network round-trip; overlap them so
+                # the DirEntry caches are warm before formatting.
+                source = list(source)
+                with ThreadPoolExecutor(max_workers=32) as pool:
+                    for _ in pool.map(
+                        lambda entry: entry.stat(follow_symlinks=False), source
+                    ):
+                        pass
+            rows = [
+                (
+                    not entry.is_dir(follow_symlinks=False),
+                    entry.name.casefold(),
+                    index,
+                    self.format_detailed(entry),
+                )
+                for index, entry in enumerate(source)
+            ]
+            rows.sort()
+            if offset or limit is not None:
+                end = None if limit is None else offset + limit
+                rows = rows[offset:end]
+            return (row[3] for row in rows)
+        # Simple mode needs names only, so os.listdir avoids building a
+        # DirEntry (and its type/metadata machinery) per entry.
+        names = os.listdir(path)
+        names.sort(key=str.casefold)
+        if offset or limit is not None:
+            end = None if limit is None else offset + limit
+            names = names[offset:end]
+        return (name + "\n" for name in names)
+
+    @staticmethod
+    def format_detailed(entry: os.DirEntry) -> str:
+        st = entry.stat(follow_symlinks=False)
+        second = int(st.st_mtime)
+        mtime = _MTIME_CACHE.get(second)
+        if mtime is None:
+            lt = time.localtime(second)
+            mtime = (
+                f"{lt.tm_year:04d}-{lt.tm_mon:02d}-{lt.tm_mday:02d}"
+                f" {lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+            )
+            if len(_MTIME_CACHE) > 4096:
+                _MTIME_CACHE.clear()
+            _MTIME_CACHE[second] = mtime
+        return "".join((
+            _MODE_STR[st.st_mode & 0o7777],
+            " ",
+            str(st.st_size).rjust(10),
+            " ",
+            mtime,
+            " ",
+            entry.name,
+            "\n",
+        ))
+
+    @overload
+    def cat(
+            self,
+            filename: PathLike[str] | str,
+            mode: Literal[FileReadMode.string] = ...,
+    ) -> Iterator[str]: ...
+
+    @overload
+    def cat(
+            self,
+            filename: PathLike[str] | str,
+            mode: Literal[FileReadMode.bytes],
+    ) -> Iterator[bytes]: ...
 
     def cat(
             self,
             filename: PathLike[str] | str,
             mode: FileReadMode = FileReadMode.string,  # Убрать Literal, использовать сам Enum
-    ) -> str | bytes:
-        path = Path(filename)
-        if not path.exists(follow_symlinks=True):
-            self._logger.error(f"File not found: {filename}")
+    ) -> Iterator[str | bytes]:
+        path = os.fspath(filename)
+        st = self._stat_or_none(path)
+        if st is None:
+            self._logger.error("File not found: %s", filename)
             raise FileNotFoundError(filename)
-        if path.is_dir(follow_symlinks=True):
-            self._logger.error(f"You entered {filename} is not a file")
+        if stat.S_ISDIR(st.st_mode):
+            self._logger.error("You entered %s is not a file", filename)
             raise IsADirectoryError(f"You entered {filename} is not a file")
+        self._logger.info("Reading file %s in mode %s", filename, mode)
+        return self._read_chunks(path, mode, st.st_size)
+
+    def _read_mmap(
+            self,
+            path: str,
+            mode: FileReadMode,
+    ) -> Iterator[str | bytes]:
+        import codecs
+        import mmap
+
+        with open(path, "rb") as file, mmap.mmap(
+            file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            view = memoryview(mm)
+            try:
+                if mode == FileReadMode.string:
+                    decoder = codecs.getincrementaldecoder("utf-8")()
+                    for start in range(0, len(view), READ_CHUNK_SIZE):
+                        yield decoder.decode(view[start:start + READ_CHUNK_SIZE])
+                    tail = decoder.decode(b"", True)
+                    if tail:
+                        yield tail
+                else:
+                    for start in range(0, len(view), READ_CHUNK_SIZE):
+                        yield bytes(view[start:start + READ_CHUNK_SIZE])
+            finally:
+                view.release()
+
+    def _read_chunks(
+            self,
+            path: str,
+            mode: FileReadMode,
+            size: int,
+    ) -> Iterator[str | bytes]:
         try:
-                self._logger.info(f"Reading file {filename} in mode {mode}")
+            if size > MMAP_THRESHOLD:
+                # Let the kernel page the file in on demand instead of
+                # pulling it through the read buffer.
+                yield from self._read_mmap(path, mode)
+            else:
+                # Small files: one unbuffered read, skipping the
+                # BufferedReader/TextIOWrapper layers and their extra
+                # seek/isatty syscalls.
+                with open(path, "rb", buffering=0) as file:
+                    data = file.readall()
                 if mode == FileReadMode.string:
-                    return path.read_text(encoding="utf-8")
-                elif mode == FileReadMode.bytes:
-                    return path.read_bytes()
+                    yield data.decode("utf-8")
+                else:
+                    yield data
         except OSError as e:
-            self._logger.exception(f"Error reading {filename}: {e}")
+            self._logger.exception("Error reading %s: %s", path, e)
             raise
+
+    def grep(
+            self,
+            pattern: re.Pattern[bytes],
+            path: PathLike[str] | str,
+    ) -> Iterator[bytes]:
+        file_path = Path(path)
+        st = self._stat_or_none(file_path)
+        if st is None:
+            self._logger.error("File not found: %s", path)
+            raise FileNotFoundError(path)
+        self._logger.info("Searching %r in %s", pattern.pattern, path)
+        if stat.S_ISDIR(st.st_mode):
+            return self._grep_tree(pattern, file_path)
+        if st.st_size > MMAP_THRESHOLD:
+            return self._grep_mmap(pattern, file_path)
+        return self._grep_lines(pattern, file_path)
+
+    def _grep_mmap(
+            self,
+            pattern: re.Pattern[bytes],
+            path: Path,
+    ) -> Iterator[bytes]:
+        """
+        Search the whole file in one finditer pass over an mmap
+        instead of iterating lines: line boundaries are only located
+        around actual matches, and line numbers are counted
+        incrementally between them.
+        """
+        import mmap
+
+        # ^ and $ must keep matching at line boundaries when the
+        # pattern runs against the full buffer.
+        pattern = re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+        try:
+            with path.open("rb") as file, mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                lineno = 1
+                pos = 0
+                last_line_start = -1
+                for match in pattern.finditer(mm):
+                    line_start = mm.rfind(b"\n", 0, match.start()) + 1
+                    if line_start == last_line_start:
+                        continue  # further matches on an emitted line
+                    lineno += mm[pos:line_start].count(b"\n")
+                    pos = line_start
+                    last_line_start = line_start
+                    line_end = mm.find(b"\n", match.end())
+                    line_end = len(mm) if line_end == -1 else line_end + 1
+                    yield f"{lineno}:".encode() + mm[line_start:line_end]
+        except OSError as e:
+            self._logger.exception("Error searching %s: %s", path, e)
+            raise
+
+    @staticmethod
+    def _literal_prefix(pattern: bytes) -> bytes:
+        """
+        Longest leading literal run every match must contain, used to
+        reject lines with bytes.find before paying for the regex
+        engine. Empty when the pattern starts with a metacharacter.
+        """
+        prefix = bytearray()
+        for byte in pattern:
+            if byte in b"?*+{":
+                # Quantifies the previous byte, which may repeat zero
+                # times, so it is not guaranteed either.
+                if prefix:
+                    del prefix[-1]
+                break
+            if byte in b"|":
+                # Top-level alternation: the other branch need not
+                # contain the accumulated run at all.
+                return b""
+            if byte in b"\\^$.()[":
+                break
+            prefix.append(byte)
+        return bytes(prefix)
+
+    def _grep_file(
+            self,
+            pattern: re.Pattern[bytes],
+            path: str,
+    ) -> list[bytes]:
+        """Collect matches of one file as path:lineno:line records."""
+        prefix = os.fsencode(path) + b":"
+        literal = self._literal_prefix(pattern.pattern)
+        ignore_case = bool(pattern.flags & re.IGNORECASE)
+        if ignore_case:
+            literal = literal.lower()
+        try:
+            if os.stat(path).st_size > MMAP_THRESHOLD:
+                # Too big to slurp; stream line by line instead.
+                with open(path, "rb", buffering=GREP_BUFFER_SIZE) as file:
+                    return [
+                        prefix + f"{lineno}:".encode() + line
+                        for lineno, line in enumerate(file, 1)
+                        if (
+                            not literal
+                            or literal
+                            in (line.lower() if ignore_case else line)
+                        )
+                        and pattern.search(line)
+                    ]
+            with open(path, "rb", buffering=0) as file:
+                data = file.readall()
+        except OSError:
+            self._logger.debug("Skipping unreadable file %s", path)
+            return []
+        # Whole-buffer prescreen rejects match-free files before any
+        # line splitting happens.
+        if literal and literal not in (data.lower() if ignore_case else data):
+            return []
+        return [
+            prefix + f"{lineno}:".encode() + line
+            for lineno, line in enumerate(data.splitlines(keepends=True), 1)
+            if (not literal or literal in (line.lower() if ignore_case else line))
+            and pattern.search(line)
+        ]
+
+    def _grep_tree(
+            self,
+            pattern: re.Pattern[bytes],
+            root: Path,
+    ) -> Iterator[bytes]:
+        files: list[str] = []
+        for dirpath, _dirs, names in os.walk(root):
+            for name in names:
+                files.append(os.path.join(dirpath, name))
+        # Line scanning drops the GIL inside the regex engine and the
+        # buffered reads, so a modest pool overlaps I/O across files.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for matches in pool.map(
+                lambda file: self._grep_file(pattern, file), files
+            ):
+                yield from matches
+
+    def _grep_lines(
+            self,
+            pattern: re.Pattern[bytes],
+            path: Path,
+    ) -> Iterator[bytes]:
+        literal = self._literal_prefix(pattern.pattern)
+        ignore_case = bool(pattern.flags & re.IGNORECASE)
+        if ignore_case:
+            literal = literal.lower()
+        try:
+            # Only reached for files at or below MMAP_THRESHOLD, so
+            # one raw read plus the C-level line splitter replaces N
+            # buffered-iterator __next__ calls.
+            with path.open("rb", buffering=0) as file:
+                data = file.readall()
+        except OSError as e:
+            self._logger.exception("Error searching %s: %s", path, e)
+            raise
+        # Whole-buffer prescreen rejects match-free files before any
+        # line splitting happens.
+        if literal and literal not in (data.lower() if ignore_case else data):
+            return
+        for lineno, line in enumerate(data.splitlines(keepends=True), 1):
+            if literal and literal not in (
+                line.lower() if ignore_case else line
+            ):
+                continue
+            if pattern.search(line):
+                yield f"{lineno}:".encode() + line
+
+    def cd(self, path: PathLike[str] | str) -> Path:
+        new_path = os.fspath(path)
+        if new_path.startswith("~"):
+            new_path = _expanduser(new_path)
+        if ".." in new_path.split(os.sep) or os.path.islink(new_path):
+            new_path = os.path.realpath(new_path)
+        else:
+            # Plain paths only need string normalization, not the
+            # full symlink walk realpath does.
+            if not os.path.isabs(new_path):
+                new_path = os.path.join(_getcwd(), new_path)
+            new_path = os.path.normpath(new_path)
+        st = self._stat_or_none(new_path)
+        if st is None:
+            self._logger.error("Folder not found: %s", new_path)
+            raise FileNotFoundError(new_path)
+        if not stat.S_ISDIR(st.st_mode):
+            self._logger.error("You entered %s is not a directory", new_path)
+            raise NotADirectoryError(new_path)
+        _chdir(new_path)
+        self._logger.info("Changed directory to %s", new_path)
+        return Path(new_path)
+
+    @staticmethod
+    def _ensure_dir(dir_path: str, known: set[str]) -> None:
+        """Memoized makedirs so sibling copies share one mkdir."""
+        if dir_path and dir_path not in known:
+            os.makedirs(dir_path, exist_ok=True)
+            known.add(dir_path)
+
+    @staticmethod
+    def _fast_copy(src: str, dst: str) -> None:
+        """
+        Copy one file through the platform zero-copy path, preserving
+        metadata like shutil.copy2.
+        """
+        if sys.platform == "win32":
+            import ctypes
+            if not ctypes.windll.kernel32.CopyFileExW(
+                src, dst, None, None, None, 0
+            ):
+                raise ctypes.WinError()
+            shutil.copystat(src, dst)
+            return
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            in_fd = fsrc.fileno()
+            out_fd = fdst.fileno()
+            size = os.fstat(in_fd).st_size
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            except OSError:
+                fsrc.seek(0)
+                fdst.seek(0)
+                fdst.truncate()
+                shutil.copyfileobj(fsrc, fdst, IO_BUF)
+        shutil.copystat(src, dst)
+
+    def cp(
+            self,
+            source: PathLike[str] | str,
+            destination: PathLike[str] | str,
+            recursive: bool = False,
+    ) -> None:
+        # Plain strings end to end: pathlib would re-parse the path
+        # and allocate a new Path per .parent/.name access.
+        src = os.fspath(source)
+        dst = os.fspath(destination)
+        st = self._stat_or_none(src)
+        if st is None:
+            self._logger.error("File not found: %s", source)
+            raise FileNotFoundError(source)
+        if stat.S_ISDIR(st.st_mode):
+            if not recursive:
+                self._logger.error("%s is a directory, use recursive copy", source)
+                raise IsADirectoryError(f"{source} is a directory, use recursive copy")
+            self._logger.info("Copying directory %s to %s", src, dst)
+            # copytree walks with one scandir per directory and reuses
+            # the cached entry types, so it issues far fewer stats than
+            # a hand-rolled walk; dirs_exist_ok merges into an existing
+            # destination instead of failing. Copies are submitted to
+            # the copier's workers so the walk overlaps the data moves.
+            with _MultithreadedCopier(self._fast_copy) as copier:
+                shutil.copytree(
+                    src, dst, dirs_exist_ok=True, copy_function=copier.copy
+                )
+                copier.wait_all()
+        else:
+            # shutil.copy2 semantics: an existing directory
+            # destination receives the file under its source name.
+            dst_st = self._stat_or_none(dst)
+            if dst_st is not None and stat.S_ISDIR(dst_st.st_mode):
+                dst = os.path.join(dst, os.path.basename(src))
+            else:
+                self._ensure_dir(os.path.dirname(dst), set())
+            self._logger.info("Copying file %s to %s", src, dst)
+            self._fast_copy(src, dst)
+
+    def mv(
+            self,
+            source: PathLike[str] | str,
+            destination: PathLike[str] | str,
+    ) -> None:
+        if self._stat_or_none(source) is None:
+            self._logger.error("File not found: %s", source)
+            raise FileNotFoundError(source)
+        self._logger.info("Moving %s to %s", source, destination)
+        src_s = os.fspath(source)
+        dst_s = os.fspath(destination)
+        same_drive = (
+            os.path.splitdrive(src_s)[0].lower()
+            == os.path.splitdrive(dst_s)[0].lower()
+        )
+        parent = os.path.dirname(dst_s)
+        if parent and not os.path.isdir(parent):
+            os.makedirs(parent, exist_ok=True)
+        if same_drive:
+            try:
+                # Atomic single-syscall rename; skips shutil.move's
+                # cross-device introspection.
+                os.replace(src_s, dst_s)
+                return
+            except OSError:
+                pass  # different mount despite the drive match
+        shutil.move(src_s, dst_s)
+
+    # Whether every call _fast_rmtree needs can take a directory fd,
+    # letting the kernel skip the full path walk per entry.
+    _RMTREE_DIR_FD = (
+        os.open in os.supports_dir_fd
+        and os.unlink in os.supports_dir_fd
+        and os.rmdir in os.supports_dir_fd
+        and os.scandir in os.supports_fd
+    )
+
+    @classmethod
+    def _fast_rmtree(cls, path: str, dir_fd: int | None = None) -> None:
+        """
+        Remove a tree with one scandir per directory, unlinking via
+        the DirEntry names so no extra stat or Path object is built
+        per file. Where dir_fd is supported each entry is removed
+        relative to its directory's fd, so the kernel resolves one
+        name instead of re-walking the whole path per unlink.
+        """
+        if cls._RMTREE_DIR_FD:
+            fd = os.open(path, os.O_RDONLY, dir_fd=dir_fd)
+            try:
+                with os.scandir(fd) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            cls._fast_rmtree(entry.name, dir_fd=fd)
+                        else:
+                            os.unlink(entry.name, dir_fd=fd)
+            finally:
+                os.close(fd)
+            os.rmdir(path, dir_fd=dir_fd)
+            return
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    cls._fast_rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
+
+    def rm(
+            self,
+            path: PathLike[str] | str,
+            recursive: bool = False,
+    ) -> None:
+        target = os.fspath(path)
+        # lstat, not stat: a symlink to a directory must be unlinked
+        # itself, never recursed through to the target's contents.
+        try:
+            st = os.lstat(target)
+        except OSError:
+            st = None
+        if st is None:
+            self._logger.error("File not found: %s", path)
+            raise FileNotFoundError(path)
+        if stat.S_ISDIR(st.st_mode):
+            if not recursive:
+                self._logger.error("%s is a directory, use recursive remove", path)
+                raise IsADirectoryError(f"{path} is a directory, use recursive remove")
+            self._logger.info("Removing directory %s", target)
+            self._fast_rmtree(target)
+        else:
+            self._logger.info("Removing file %s", target)
+            os.unlink(target)
+
+    _isal_checked = False
+
+    @classmethod
+    def _wire_isal_deflate(cls, zipfile_mod: ModuleType) -> None:
+        """
+        Rebind zipfile's zlib globals to isal's SIMD deflate, which is
+        a drop-in replacement several times faster. Purely optional -
+        absence falls back to stdlib zlib - and attempted only once
+        per process, not per archive.
+        """
+        if cls._isal_checked:
+            return
+        cls._isal_checked = True
+        try:
+            from isal import isal_zlib  # type: ignore[import-not-found]
+        except ImportError:
+            return
+        zipfile_mod.zlib = isal_zlib  # type: ignore[attr-defined]
+        zipfile_mod.crc32 = isal_zlib.crc32  # type: ignore[attr-defined]
+
+    def zip(
+            self,
+            source: PathLike[str] | str,
+            archive: PathLike[str] | str,
+    ) -> None:
+        src = Path(source)
+        st = self._stat_or_none(src)
+        if st is None:
+            self._logger.error("Folder not found: %s", source)
+            raise FileNotFoundError(source)
+        if not stat.S_ISDIR(st.st_mode):
+            self._logger.error("You entered %s is not a directory", source)
+            raise NotADirectoryError(source)
+        self._logger.info("Zipping %s to %s", src, archive)
+        import mmap
+        import zipfile
+
+        self._wire_isal_deflate(zipfile)
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            # os.walk already separates files from directories using
+            # the readdir type cache, so no per-entry is_dir stat is
+            # paid the way rglob("*") would.
+            root_s = os.fspath(src)
+            for dirpath, _dirs, names in os.walk(root_s):
+                for name in names:
+                    item = os.path.join(dirpath, name)
+                    arcname = os.path.relpath(item, root_s)
+                    # Stream the member instead of zf.write so the
+                    # data moves through one large reusable buffer;
+                    # the raw source read skips the BufferedReader
+                    # layer. zip64 is decided up front from the known
+                    # size instead of zipfile guessing conservatively.
+                    info = zipfile.ZipInfo.from_file(item, arcname)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with open(item, "rb", buffering=0) as fsrc, zf.open(
+                        info, "w", force_zip64=info.file_size >= 1 << 31
+                    ) as zdst:
+                        if info.file_size >= 64 * 1024:
+                            # Feed the compressor straight from the
+                            # page cache - no intermediate read-buffer
+                            # copy - with the kernel prefetching ahead
+                            # of the sequential scan.
+                            with mmap.mmap(
+                                fsrc.fileno(), 0, access=mmap.ACCESS_READ
+                            ) as mm:
+                                if hasattr(mm, "madvise"):
+                                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                                zdst.write(mm)
+                        else:
+                            # Below ~64 KiB the mmap setup costs more
+                            # than the copy it saves.
+                            shutil.copyfileobj(fsrc, zdst, 1024 * 1024)
+
+    def unzip(
+            self,
+            archive: PathLike[str] | str,
+            destination: PathLike[str] | str,
+    ) -> None:
+        arc = Path(archive)
+        if self._stat_or_none(arc) is None:
+            self._logger.error("File not found: %s", archive)
+            raise FileNotFoundError(archive)
+        self._logger.info("Unzipping %s to %s", arc, destination)
+        import zipfile
+        with zipfile.ZipFile(arc) as zf:
+            zf.extractall(destination)
+
+    def tar_dir(
+            self,
+            source: PathLike[str] | str,
+            archive: PathLike[str] | str,
+    ) -> None:
+        src = Path(source)
+        st = self._stat_or_none(src)
+        if st is None:
+            self._logger.error("Folder not found: %s", source)
+            raise FileNotFoundError(source)
+        if not stat.S_ISDIR(st.st_mode):
+            self._logger.error("You entered %s is not a directory", source)
+            raise NotADirectoryError(source)
+        self._logger.info("Archiving %s to %s", src, archive)
+        import tarfile
+
+        # gzip is where tar_dir burns its CPU; prefer isal's SIMD
+        # deflate, then a pigz subprocess compressing on all cores,
+        # and only then the single-threaded stdlib gzip.
+        try:
+            from isal import igzip
+        except ImportError:
+            igzip = None
+        if igzip is not None:
+            with open(archive, "wb") as raw, igzip.IGzipFile(
+                fileobj=raw, mode="wb", compresslevel=1
+            ) as gz, tarfile.open(fileobj=gz, mode="w|") as tf:
+                tf.add(src, arcname=src.name)
+            return
+        pigz = shutil.which("pigz")
+        if pigz is not None:
+            import subprocess
+
+            with open(archive, "wb") as raw:
+                proc = subprocess.Popen(
+                    [pigz, "-p", str(os.cpu_count() or 1)],
+                    stdin=subprocess.PIPE,
+                    stdout=raw,
+                )
+                stdin = proc.stdin
+                assert stdin is not None  # stdin=PIPE above
+                try:
+                    with tarfile.open(fileobj=stdin, mode="w|") as tf:
+                        tf.add(src, arcname=src.name)
+                finally:
+                    # Always close and reap, so a failed tf.add does
+                    # not leak the compressor process.
+                    stdin.close()
+                    returncode = proc.wait()
+                if returncode:
+                    raise OSError(f"pigz exited with code {returncode}")
+            return
+        with tarfile.open(archive, "w:gz") as tf:
+            tf.add(src, arcname=src.name)
+
+    def untar(
+            self,
+            archive: PathLike[str] | str,
+            destination: PathLike[str] | str,
+    ) -> None:
+        arc = Path(archive)
+        if self._stat_or_none(arc) is None:
+            self._logger.error("File not found: %s", archive)
+            raise FileNotFoundError(archive)
+        self._logger.info("Extracting %s to %s", arc, destination)
+        import tarfile
+        with tarfile.open(arc) as tf:
+            tf.extractall(destination)